@@ -1,31 +1,192 @@
+import asyncio
+import functools
+import logging
 import os
+import struct
 import time
-from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Set
 
-from fastapi import FastAPI, HTTPException
+import httpx
+import orjson
+from fastapi import FastAPI, HTTPException, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
-import json
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
 
 from aptos_sdk.account import Account
+from aptos_sdk.account_sequence_number import AccountSequenceNumber
 from aptos_sdk.account_address import AccountAddress
-from aptos_sdk.async_client import RestClient
-from aptos_sdk.transactions import EntryFunction, TransactionArgument, TransactionPayload
-from aptos_sdk.bcs import Serializer
+from aptos_sdk.async_client import ApiError, RestClient
+from aptos_sdk.transactions import EntryFunction, ModuleId, TransactionPayload
 
 # Load environment variables
 load_dotenv()
 
-# Debug: Print environment variables (without exposing full private key)
-print(f"DEBUG: NODE_URL: {os.getenv('NODE_URL', 'NOT_SET')}")
-print(f"DEBUG: PAYER_ADDRESS: {os.getenv('PAYER_ADDRESS', 'NOT_SET')}")
-print(f"DEBUG: MODULE_ADDRESS: {os.getenv('MODULE_ADDRESS', 'NOT_SET')}")
-print(f"DEBUG: PAYER_PRIVATE_KEY_HEX: {os.getenv('PAYER_PRIVATE_KEY_HEX', 'NOT_SET')[:20]}...")
+# Logging; set LOG_LEVEL=DEBUG to see configuration and account details (never key material)
+logger = logging.getLogger("tuition")
+# getLevelName maps known names to their int level; unknown values fall back to WARNING instead of failing startup
+LOG_LEVEL = logging.getLevelName(os.getenv("LOG_LEVEL", "WARNING").strip().upper())
+logger.setLevel(LOG_LEVEL if isinstance(LOG_LEVEL, int) else logging.WARNING)
+if not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
 
-app = FastAPI(title="Tuition Escrow API", version="1.0.0")
+# Configuration
+NODE_URL = os.getenv("NODE_URL", "https://fullnode.devnet.aptoslabs.com/v1")
+PAYER_PRIVATE_KEY_HEX = os.getenv("PAYER_PRIVATE_KEY_HEX")
+PAYER_ADDRESS = os.getenv("PAYER_ADDRESS")
+MODULE_ADDRESS = os.getenv("MODULE_ADDRESS")
+# Worker processes (see __main__); the semaphores below are per process, so the fullnode budget is split across them
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+# Cap on concurrent requests to the fullnode across all workers; callers beyond it queue instead of fanning out
+APTOS_MAX_INFLIGHT = int(os.getenv("APTOS_MAX_INFLIGHT", "32"))
+APTOS_MAX_INFLIGHT_PER_WORKER = max(1, APTOS_MAX_INFLIGHT // WEB_CONCURRENCY)
+
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("NODE_URL: %s", NODE_URL)
+    logger.debug("PAYER_ADDRESS: %s", PAYER_ADDRESS or "NOT_SET")
+    logger.debug("MODULE_ADDRESS: %s", MODULE_ADDRESS or "NOT_SET")
+    logger.debug("PAYER_PRIVATE_KEY_HEX: %s", "set" if PAYER_PRIVATE_KEY_HEX else "NOT_SET")
+
+# Module-derived constants, computed once instead of per request
+# The address is normalised to the form the node uses in type and function names
+MODULE_ACCOUNT = AccountAddress.from_str_relaxed(MODULE_ADDRESS) if MODULE_ADDRESS else None
+MODULE_QNAME = f"{MODULE_ACCOUNT}::tuition_escrow_v2"
+AGREEMENT_CREATED_EVENT_TYPE = f"{MODULE_QNAME}::AgreementCreatedEvent"
+# Bound on remembered unpolled tx hashes, so create/pay calls nobody polls can't grow memory forever
+MAX_TRACKED_TX_HASHES = 1024
+
+SECS_PER_DAY = 86_400
+# Upper bound for interval/grace periods; keeps the seconds values well inside u64
+MAX_PERIOD_DAYS = 10 * 365
+
+# Store reads are cached briefly; entries are dropped whenever a create/pay transaction commits
+STORE_CACHE_NAMESPACE = "store"
+STORE_CACHE_TTL_SECS = 2
+
+# /api/agreements fetches get_agreements_range pages of this many ids, at most this many at a time
+LIST_PAGE_SIZE = 100
+LIST_MAX_CONCURRENCY = 16
+
+# Parsed once; every entry-function payload shares this ModuleId instead of re-parsing MODULE_QNAME
+MODULE_ID = ModuleId.from_str(MODULE_QNAME) if MODULE_ADDRESS else None
+_U64 = struct.Struct("<Q")
+U64_MAX = 2**64 - 1
+
+def encode_u64(value: int) -> bytes:
+    """BCS encoding of a u64 argument (8 bytes, little-endian)"""
+    return _U64.pack(value)
+
+def entry_function_payload(function: str, *u64_args: int) -> TransactionPayload:
+    """Build a tuition_escrow_v2 entry-function payload whose arguments are all u64.
+
+    The module id is precomputed and the arguments are packed directly, so the only
+    per-request BCS work left is the SDK serializing the argument vector when it signs.
+    """
+    return TransactionPayload(EntryFunction(MODULE_ID, function, [], [encode_u64(v) for v in u64_args]))
+
+# Aptos client, created inside the lifespan so its httpx.AsyncClient is bound to the running loop
+client: Optional[RestClient] = None
+# Local allocator for the payer's sequence numbers, created on first submit and dropped with the client
+payer_sequence_numbers: Optional[AccountSequenceNumber] = None
+
+# Fullnode responses worth retrying (rate limiting and transient server errors)
+RPC_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RPC_MAX_RETRIES = 3
+RPC_BACKOFF_SECS = 0.25
+# Longest we will sleep before a retry; a node asking for more (Retry-After) gets its response returned as-is
+RPC_MAX_BACKOFF_SECS = 5.0
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that bounds in-flight fullnode requests and retries 429/5xx with exponential backoff.
+
+    The semaphore is held only while a request is on the wire, never during backoff sleeps.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_inflight: int):
+        self._transport = transport
+        self._sem = asyncio.Semaphore(max_inflight)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RPC_MAX_RETRIES + 1):
+            async with self._sem:
+                response = await self._transport.handle_async_request(request)
+            if response.status_code not in RPC_RETRY_STATUS_CODES or attempt == RPC_MAX_RETRIES:
+                return response
+            delay = RPC_BACKOFF_SECS * 2 ** attempt
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            if delay > RPC_MAX_BACKOFF_SECS:
+                return response
+            await response.aclose()
+            logger.debug("Fullnode returned %s for %s, retrying in %.2fs", response.status_code, request.url, delay)
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+async def create_rest_client() -> RestClient:
+    """RestClient whose transport is one multiplexed HTTP/2 connection pool to the fullnode"""
+    rest_client = RestClient(NODE_URL)
+    # The SDK doesn't take limits/timeouts, so swap in our own httpx client (keeping the SDK headers)
+    sdk_client = rest_client.client
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=APTOS_MAX_INFLIGHT_PER_WORKER,
+            max_keepalive_connections=APTOS_MAX_INFLIGHT_PER_WORKER,
+        ),
+    )
+    rest_client.client = httpx.AsyncClient(
+        transport=RateLimitedTransport(transport, APTOS_MAX_INFLIGHT_PER_WORKER),
+        # No pool timeout (as in the SDK): requests queued behind the in-flight cap wait rather than fail
+        timeout=httpx.Timeout(10.0, pool=None),
+        headers=sdk_client.headers,
+    )
+    await sdk_client.aclose()
+    return rest_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the Aptos client on startup and close it on shutdown"""
+    global client, payer_sequence_numbers
+    client = await create_rest_client()
+    FastAPICache.init(InMemoryBackend(), prefix="tuition")
+    try:
+        yield
+    finally:
+        payer_sequence_numbers = None
+        await client.close()
+        client = None
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route that hands its handler an ORJSONRequest so request bodies are parsed with orjson"""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return custom_route_handler
+
+app = FastAPI(title="Tuition Escrow API", version="1.0.0", lifespan=lifespan)
+app.router.route_class = ORJSONRoute
 
 # Add CORS middleware
 app.add_middleware(
@@ -39,58 +200,173 @@ app.add_middleware(
 # Mount static files (for serving the HTML file)
 app.mount("/static", StaticFiles(directory="../frontend"), name="static")
 
-# Configuration
-NODE_URL = os.getenv("NODE_URL", "https://fullnode.devnet.aptoslabs.com/v1")
-PAYER_PRIVATE_KEY_HEX = os.getenv("PAYER_PRIVATE_KEY_HEX")
-PAYER_ADDRESS = os.getenv("PAYER_ADDRESS")
-MODULE_ADDRESS = os.getenv("MODULE_ADDRESS")
+def _normalize_private_key(raw: Optional[str]) -> Optional[str]:
+    """Strip the ed25519-priv- / 0x prefixes and return a clean 0x-prefixed hex key"""
+    if not raw:
+        return None
+    private_key = raw.strip()
+    if private_key.startswith("ed25519-priv-"):
+        private_key = private_key[len("ed25519-priv-"):]
+    if private_key.startswith("0x"):
+        private_key = private_key[2:]
+    return "0x" + private_key
 
-# Initialize Aptos client
-client = RestClient(NODE_URL)
+# Normalized once at import; the env var does not change for the life of the process
+PAYER_PRIVATE_KEY = _normalize_private_key(PAYER_PRIVATE_KEY_HEX)
+
+@functools.lru_cache(maxsize=1)
+def _build_payer_account() -> Account:
+    """Derive the payer Account once; the Ed25519 public key derivation is not repeated per request"""
+    account = Account.load_key(PAYER_PRIVATE_KEY)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Loaded payer account %s", account.address())
+    return account
 
 async def get_payer_account() -> Account:
     """Get the payer account from private key"""
-    if not PAYER_PRIVATE_KEY_HEX:
+    if not PAYER_PRIVATE_KEY:
         raise HTTPException(status_code=500, detail="PAYER_PRIVATE_KEY_HEX not configured")
-    
-    # Remove prefix if present and clean the private key
-    private_key = PAYER_PRIVATE_KEY_HEX.strip()
-    print(f"DEBUG: Original private key: {private_key[:20]}...{private_key[-20:]}")
-    
-    if private_key.startswith("ed25519-priv-"):
-        private_key = private_key[14:]  # Remove "ed25519-priv-" prefix
-        print(f"DEBUG: After removing prefix: {private_key[:20]}...{private_key[-20:]}")
-    
-    # Remove any existing 0x prefix and add a clean one
-    if private_key.startswith("0x"):
-        private_key = private_key[2:]  # Remove existing 0x
-        print(f"DEBUG: After removing 0x: {private_key[:20]}...{private_key[-20:]}")
-    elif private_key.startswith("x"):  # Handle case where prefix removal left just 'x'
-        private_key = private_key[1:]  # Remove the 'x'
-        print(f"DEBUG: After removing x: {private_key[:20]}...{private_key[-20:]}")
-    
-    private_key = "0x" + private_key  # Add clean 0x prefix
-    print(f"DEBUG: Final private key: {private_key[:10]}...{private_key[-10:]}")
-    
+
     try:
-        return Account.load_key(private_key)
+        return _build_payer_account()
     except Exception as e:
-        print(f"DEBUG: Error loading account: {str(e)}")  # Debug line
+        logger.debug("Error loading account: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to load account: {str(e)}")
 
+async def wait_for_transaction_json(tx_hash: str) -> Dict[str, Any]:
+    """Wait for a transaction to commit and return its JSON (including emitted events).
+
+    Same polling as RestClient.wait_for_transaction, but keeps the final response so
+    callers don't need another round-trip to see what the transaction did.
+    """
+    for _ in range(client.client_config.transaction_wait_in_seconds + 1):
+        try:
+            tx = await client.transaction_by_hash(tx_hash)
+        except ApiError as e:
+            # The node answers 404 until the transaction has been indexed
+            if e.status_code != 404:
+                raise
+            tx = None
+        if tx is not None and tx.get("type") != "pending_transaction":
+            if not tx.get("success"):
+                raise RuntimeError(f"Transaction {tx_hash} failed: {tx.get('vm_status')}")
+            return tx
+        await asyncio.sleep(1)
+    raise TimeoutError(f"Transaction {tx_hash} timed out")
+
+def created_agreement_id(tx: Dict[str, Any]) -> Optional[int]:
+    """Read the new agreement id from the AgreementCreatedEvent emitted by create_agreement"""
+    for event in tx.get("events") or []:
+        if event.get("type") == AGREEMENT_CREATED_EVENT_TYPE:
+            return int(event["data"]["id"])
+    return None
+
+def view_error(e: ApiError, not_found_detail: str) -> HTTPException:
+    """Map a failed view call to an HTTP error.
+
+    The node answers 400 when the view aborts (e.g. missing Store or agreement id); that is a 404 here.
+    Anything else (429/5xx left over after retries) is an upstream failure, not a missing agreement.
+    """
+    if e.status_code == 400:
+        return HTTPException(status_code=404, detail=f"{not_found_detail}: {str(e)}")
+    if e.status_code in (429, 503):
+        return HTTPException(status_code=503, detail=f"Aptos node unavailable ({e.status_code}): {str(e)}")
+    return HTTPException(status_code=502, detail=f"Aptos node error ({e.status_code}): {str(e)}")
+
+async def call_view(function: str, arguments: List[str]) -> List[Any]:
+    """Call a tuition_escrow_v2 view function and return its decoded return values"""
+    result = await client.view(f"{MODULE_QNAME}::{function}", [], arguments)
+    return orjson.loads(result)
+
+# In-flight view calls keyed by function and arguments, so concurrent identical reads share one request
+_inflight_views: Dict[str, asyncio.Future] = {}
+
+async def call_view_coalesced(function: str, arguments: List[str]) -> List[Any]:
+    """Like call_view, but callers asking for the same result at the same time await a single node call"""
+    key = f"{function}:{','.join(arguments)}"
+    task = _inflight_views.get(key)
+    if task is None:
+        task = asyncio.ensure_future(call_view(function, arguments))
+        _inflight_views[key] = task
+        task.add_done_callback(lambda _: _inflight_views.pop(key, None))
+    # shield: one caller disconnecting must not cancel the fetch the others are waiting on
+    return await asyncio.shield(task)
+
+def store_cache_key(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Cache key for Store reads, scoped to the module deployment and agreement id"""
+    agreement_id = (kwargs or {}).get("agreement_id", "")
+    return f"{namespace}:{MODULE_ADDRESS}:{func.__name__}:{agreement_id}"
+
+async def invalidate_store_cache() -> None:
+    """Drop cached Store reads after a state-changing transaction commits"""
+    await FastAPICache.clear(namespace=STORE_CACHE_NAMESPACE)
+
+# Hashes of create/pay transactions this process submitted without waiting; /api/tx clears the cache once per hash
+_unpolled_tx_hashes: Dict[str, None] = {}
+
+def track_submitted_transaction(tx_hash: str) -> None:
+    """Remember a submitted hash so its first committed poll invalidates the Store cache"""
+    _unpolled_tx_hashes[tx_hash.lower()] = None
+    if len(_unpolled_tx_hashes) > MAX_TRACKED_TX_HASHES:
+        _unpolled_tx_hashes.pop(next(iter(_unpolled_tx_hashes)))
+
+def is_module_transaction(tx: Dict[str, Any]) -> bool:
+    """True if the transaction called an entry function of our tuition_escrow_v2 deployment"""
+    function = (tx.get("payload") or {}).get("function", "")
+    return function.startswith(f"{MODULE_QNAME}::")
+
+# Background resyncs started after a failed submit; held so they aren't garbage collected mid-run
+_resync_tasks: Set[asyncio.Task] = set()
+
+async def sign_and_submit(payload: TransactionPayload) -> str:
+    """Sign a payload as the payer with a locally allocated sequence number and submit it.
+
+    The node's /accounts endpoint only counts committed transactions, so asking it for the
+    sequence number would hand the same number to back-to-back submissions that haven't
+    committed yet. AccountSequenceNumber keeps track of what is in flight instead.
+    """
+    global payer_sequence_numbers
+    payer = await get_payer_account()
+    if payer_sequence_numbers is None:
+        payer_sequence_numbers = AccountSequenceNumber(client, payer.address())
+    sequence_numbers = payer_sequence_numbers
+    sequence_number = await sequence_numbers.next_sequence_number()
+    signed_transaction = await client.create_bcs_signed_transaction(payer, payload, sequence_number=sequence_number)
+    try:
+        return await client.submit_bcs_transaction(signed_transaction)
+    except Exception:
+        # A rejected submit leaves a gap; resync with the chain (per the SDK's guidance) without blocking this caller
+        task = asyncio.ensure_future(sequence_numbers.synchronize())
+        _resync_tasks.add(task)
+        task.add_done_callback(_resync_tasks.discard)
+        raise
+
 # Pydantic models
 class TuitionAgreement(BaseModel):
-    total_amount: int = Field(..., description="Total tuition amount in octas")
-    num_installments: int = Field(..., description="Number of installments")
-    installment_amount: int = Field(..., description="Amount per installment in octas")
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+    total_amount: int = Field(..., ge=0, le=U64_MAX, description="Total tuition amount in octas")
+    num_installments: int = Field(..., ge=0, le=U64_MAX, description="Number of installments")
+    installment_amount: int = Field(..., ge=0, le=U64_MAX, description="Amount per installment in octas")
     interval_days: int = Field(..., description="Days between installments")
-    penalty_rate: int = Field(..., description="Penalty rate per day (basis points)")
+    penalty_rate: int = Field(..., ge=0, le=U64_MAX, description="Penalty rate per day (basis points)")
     grace_period_days: int = Field(..., description="Grace period before penalties")
 
+    @field_validator("interval_days", "grace_period_days")
+    @classmethod
+    def check_period_days(cls, value: int) -> int:
+        if value < 0 or value > MAX_PERIOD_DAYS:
+            raise ValueError(f"must be between 0 and {MAX_PERIOD_DAYS} days")
+        return value
+
 class PaymentRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     agreement_id: int = Field(..., description="Agreement ID to pay")
 
 class AgreementSummary(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     id: int
     payer: str
     installment_amount: int
@@ -120,65 +396,41 @@ async def health_check():
     return {"status": "healthy", "message": "Tuition Escrow API is running"}
 
 @app.post("/api/agreements", response_model=Dict[str, Any])
-async def create_agreement(agreement: TuitionAgreement):
-    """Create a new tuition agreement"""
+async def create_agreement(agreement: TuitionAgreement, wait: bool = False):
+    """Create a new tuition agreement; with wait=false, poll /api/tx/{hash} for the agreement id"""
     try:
-        payer = get_payer_account()
-        
-        # Prepare transaction arguments
-        def u64_encoder(serializer, value):
-            serializer.u64(value)
-            return serializer.output()
-        
-        def address_encoder(serializer, value):
-            value.serialize(serializer)
-            return serializer.output()
-        
         # Convert days to seconds for the contract
         start_time_secs = int(time.time())
-        interval_secs = agreement.interval_days * 24 * 60 * 60
-        grace_period_secs = agreement.grace_period_days * 24 * 60 * 60
-        
-        args = [
-            TransactionArgument(agreement.installment_amount, u64_encoder),
-            TransactionArgument(agreement.num_installments, u64_encoder),
-            TransactionArgument(start_time_secs, u64_encoder),
-            TransactionArgument(interval_secs, u64_encoder),
-            TransactionArgument(agreement.penalty_rate, u64_encoder),
-            TransactionArgument(grace_period_secs, u64_encoder),
-        ]
+        interval_secs = agreement.interval_days * SECS_PER_DAY
+        grace_period_secs = agreement.grace_period_days * SECS_PER_DAY
         
         # Create transaction payload
-        payload = TransactionPayload(
-            EntryFunction.natural(
-                f"{MODULE_ADDRESS}::tuition_escrow_v2",
-                "create_agreement",
-                [],
-                args
-            )
+        payload = entry_function_payload(
+            "create_agreement",
+            agreement.installment_amount,
+            agreement.num_installments,
+            start_time_secs,
+            interval_secs,
+            agreement.penalty_rate,
+            grace_period_secs,
         )
         
         # Submit transaction
-        signed_transaction = client.create_bcs_signed_transaction(payer, payload)
-        tx_hash = client.submit_bcs_transaction(signed_transaction)
-        
-        # Wait for transaction
-        client.wait_for_transaction(tx_hash)
+        tx_hash = await sign_and_submit(payload)
+        
+        if not wait:
+            track_submitted_transaction(tx_hash)
+            return {
+                "success": True,
+                "transaction_hash": str(tx_hash),
+                "message": "Tuition agreement submitted",
+                "agreement_id": None,
+            }
 
-        # Try to read Store.next_id and compute the created agreement id (next_id - 1)
-        created_id: Optional[int] = None
-        try:
-            store_resource = client.account_resource(
-                AccountAddress.from_hex(MODULE_ADDRESS),
-                f"{MODULE_ADDRESS}::tuition_escrow_v2::Store",
-            )
-            if store_resource and isinstance(store_resource, dict):
-                data = store_resource.get("data") or {}
-                next_id_val = data.get("next_id")
-                if next_id_val is not None:
-                    created_id = int(next_id_val) - 1
-        except Exception:
-            created_id = None
+        # Wait for transaction; the new id comes from its AgreementCreatedEvent
+        tx = await wait_for_transaction_json(tx_hash)
+        await invalidate_store_cache()
+        created_id = created_agreement_id(tx)
 
         return {
             "success": True,
@@ -191,36 +443,26 @@ async def create_agreement(agreement: TuitionAgreement):
         raise HTTPException(status_code=500, detail=f"Failed to create agreement: {str(e)}")
 
 @app.post("/api/agreements/{agreement_id}/pay", response_model=Dict[str, Any])
-async def pay_next_installment(agreement_id: int):
-    """Pay the next installment for an agreement"""
+async def pay_next_installment(agreement_id: int = Path(..., ge=0, le=U64_MAX), wait: bool = False):
+    """Pay the next installment for an agreement; with wait=false, poll /api/tx/{hash} for the outcome"""
     try:
-        payer = get_payer_account()
-        
-        # Prepare transaction arguments
-        def u64_encoder(serializer, value):
-            serializer.u64(value)
-            return serializer.output()
-        
-        args = [
-            TransactionArgument(agreement_id, u64_encoder),
-        ]
-        
         # Create transaction payload
-        payload = TransactionPayload(
-            EntryFunction.natural(
-                f"{MODULE_ADDRESS}::tuition_escrow_v2",
-                "pay_next_installment",
-                [],
-                args
-            )
-        )
+        payload = entry_function_payload("pay_next_installment", agreement_id)
         
         # Submit transaction
-        signed_transaction = client.create_bcs_signed_transaction(payer, payload)
-        tx_hash = client.submit_bcs_transaction(signed_transaction)
-        
+        tx_hash = await sign_and_submit(payload)
+        
+        if not wait:
+            track_submitted_transaction(tx_hash)
+            return {
+                "success": True,
+                "transaction_hash": str(tx_hash),
+                "message": f"Installment payment for agreement {agreement_id} submitted"
+            }
+
         # Wait for transaction
-        client.wait_for_transaction(tx_hash)
+        await client.wait_for_transaction(tx_hash)
+        await invalidate_store_cache()
         
         return {
             "success": True,
@@ -231,211 +473,92 @@ async def pay_next_installment(agreement_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to pay installment: {str(e)}")
 
-@app.get("/api/agreements/{agreement_id}", response_model=AgreementSummary)
-async def get_agreement_summary(agreement_id: int):
-    """Get agreement summary from blockchain"""
+@app.get("/api/tx/{tx_hash}", response_model=Dict[str, Any])
+async def get_transaction_status(tx_hash: str):
+    """Report whether a submitted transaction has committed; for creates, also the new agreement id"""
     try:
-        # Get the Store resource from the module address
-        store_resource = client.account_resource(
-            AccountAddress.from_hex(MODULE_ADDRESS),
-            f"{MODULE_ADDRESS}::tuition_escrow_v2::Store"
-        )
-        
-        if not store_resource:
-            raise HTTPException(status_code=404, detail="Store resource not found")
-        
-        # For now, return a basic structure since we need to parse the resource data
-        # In a real implementation, you'd parse the resource data to get agreement details
-        return AgreementSummary(
-            id=agreement_id,
-            payer="0x...",  # Would be extracted from resource
-            installment_amount=0,  # Would be extracted from resource
-            total_installments=0,    # Would be extracted from resource
-            paid_installments=0,     # Would be extracted from resource
-            start_time_secs=0,       # Would be extracted from resource
-            interval_secs=0,         # Would be extracted from resource
-            penalty_bps=0,          # Would be extracted from resource
-            grace_period_secs=0,    # Would be extracted from resource
-            total_paid=0,          # Would be extracted from resource
-        )
-        
+        tx = await client.transaction_by_hash(tx_hash)
+    except ApiError as e:
+        # The node answers 404 until the transaction has been indexed
+        if e.status_code == 404:
+            return {"committed": False, "success": False, "agreement_id": None}
+        raise HTTPException(status_code=500, detail=f"Failed to get transaction: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get agreement: {str(e)}")
-
-# ...existing code...
-
-@app.post("/api/agreements", response_model=Dict[str, Any])
-async def create_agreement(agreement: TuitionAgreement):
-    """Create a new tuition agreement"""
-    try:
-        payer = await get_payer_account()
-        
-        # Prepare transaction arguments
-        def u64_encoder(serializer, value):
-            serializer.u64(value)
-            return serializer.output()
-        
-        def address_encoder(serializer, value):
-            value.serialize(serializer)
-            return serializer.output()
-        
-        # Convert days to seconds for the contract
-        start_time_secs = int(time.time())
-        interval_secs = agreement.interval_days * 24 * 60 * 60
-        grace_period_secs = agreement.grace_period_days * 24 * 60 * 60
-        
-        args = [
-            TransactionArgument(agreement.installment_amount, u64_encoder),
-            TransactionArgument(agreement.num_installments, u64_encoder),
-            TransactionArgument(start_time_secs, u64_encoder),
-            TransactionArgument(interval_secs, u64_encoder),
-            TransactionArgument(agreement.penalty_rate, u64_encoder),
-            TransactionArgument(grace_period_secs, u64_encoder),
-        ]
-        
-        # Create transaction payload
-        payload = TransactionPayload(
-            EntryFunction.natural(
-                f"{MODULE_ADDRESS}::tuition_escrow_v2",
-                "create_agreement",
-                [],
-                args
-            )
-        )
-        
-        # Submit transaction
-        signed_transaction = await client.create_bcs_signed_transaction(payer, payload)
-        tx_hash = await client.submit_bcs_transaction(signed_transaction)
-        
-        # Wait for transaction
-        await client.wait_for_transaction(tx_hash)
-
-        # Try to read Store.next_id and compute the created agreement id (next_id - 1)
-        created_id: Optional[int] = None
-        try:
-            store_resource = await client.account_resource(
-                AccountAddress.from_hex(MODULE_ADDRESS),
-                f"{MODULE_ADDRESS}::tuition_escrow_v2::Store",
-            )
-            if store_resource and isinstance(store_resource, dict):
-                data = store_resource.get("data") or {}
-                next_id_val = data.get("next_id")
-                if next_id_val is not None:
-                    created_id = int(next_id_val) - 1
-        except Exception:
-            created_id = None
+        raise HTTPException(status_code=500, detail=f"Failed to get transaction: {str(e)}")
 
-        return {
-            "success": True,
-            "transaction_hash": str(tx_hash),
-            "message": "Tuition agreement created successfully",
-            "agreement_id": created_id,
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to create agreement: {str(e)}")
+    committed = tx.get("type") != "pending_transaction"
+    success = committed and bool(tx.get("success"))
+    # Only our own, not-yet-seen transactions may clear the cache; re-polls and foreign hashes are no-ops
+    tx_key = tx_hash.lower()
+    if committed and tx_key in _unpolled_tx_hashes:
+        del _unpolled_tx_hashes[tx_key]
+        if success and is_module_transaction(tx):
+            await invalidate_store_cache()
+    return {
+        "committed": committed,
+        "success": success,
+        "agreement_id": created_agreement_id(tx) if success else None,
+    }
 
-@app.post("/api/agreements/{agreement_id}/pay", response_model=Dict[str, Any])
-async def pay_next_installment(agreement_id: int):
-    """Pay the next installment for an agreement"""
+@app.get("/api/agreements/next_id", response_model=Dict[str, int])
+@cache(expire=STORE_CACHE_TTL_SECS, namespace=STORE_CACHE_NAMESPACE, key_builder=store_cache_key)
+async def get_next_id():
+    """Return current next_id from Store; newest agreement id is next_id - 1"""
     try:
-        payer = await get_payer_account()
-        
-        # Prepare transaction arguments
-        def u64_encoder(serializer, value):
-            serializer.u64(value)
-            return serializer.output()
-        
-        args = [
-            TransactionArgument(agreement_id, u64_encoder),
-        ]
-        
-        # Create transaction payload
-        payload = TransactionPayload(
-            EntryFunction.natural(
-                f"{MODULE_ADDRESS}::tuition_escrow_v2",
-                "pay_next_installment",
-                [],
-                args
-            )
-        )
-        
-        # Submit transaction
-        signed_transaction = await client.create_bcs_signed_transaction(payer, payload)
-        tx_hash = await client.submit_bcs_transaction(signed_transaction)
-        
-        # Wait for transaction
-        await client.wait_for_transaction(tx_hash)
-        
-        return {
-            "success": True,
-            "transaction_hash": str(tx_hash),
-            "message": f"Installment {agreement_id} paid successfully"
-        }
-        
+        (next_id_val,) = await call_view_coalesced("get_next_id", [])
+        return {"next_id": int(next_id_val)}
+    except ApiError as e:
+        raise view_error(e, "Store resource not found")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to pay installment: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get next_id: {str(e)}")
 
 @app.get("/api/agreements/{agreement_id}", response_model=AgreementSummary)
+@cache(expire=STORE_CACHE_TTL_SECS, namespace=STORE_CACHE_NAMESPACE, key_builder=store_cache_key)
 async def get_agreement_summary(agreement_id: int):
     """Get agreement summary from blockchain"""
     try:
-        # Get the Store resource from the module address
-        store_resource = await client.account_resource(
-            AccountAddress.from_hex(MODULE_ADDRESS),
-            f"{MODULE_ADDRESS}::tuition_escrow_v2::Store"
-        )
-        
-        if not store_resource:
-            raise HTTPException(status_code=404, detail="Store resource not found")
-        
-        # For now, return a basic structure since we need to parse the resource data
-        # In a real implementation, you'd parse the resource data to get agreement details
-        return AgreementSummary(
-            id=agreement_id,
-            payer="0x...",  # Would be extracted from resource
-            installment_amount=0,  # Would be extracted from resource
-            total_installments=0,    # Would be extracted from resource
-            paid_installments=0,     # Would be extracted from resource
-            start_time_secs=0,       # Would be extracted from resource
-            interval_secs=0,         # Would be extracted from resource
-            penalty_bps=0,          # Would be extracted from resource
-            grace_period_secs=0,    # Would be extracted from resource
-            total_paid=0,          # Would be extracted from resource
-        )
-        
+        (summary,) = await call_view_coalesced("get_agreement_summary", [str(agreement_id)])
+        return AgreementSummary(**summary)
+    except ApiError as e:
+        raise view_error(e, f"Agreement {agreement_id} not found")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get agreement: {str(e)}")
 
-@app.get("/api/agreements/next_id", response_model=Dict[str, int])
-async def get_next_id():
-    """Return current next_id from Store; newest agreement id is next_id - 1"""
-    try:
-        store_resource = await client.account_resource(
-            AccountAddress.from_hex(MODULE_ADDRESS),
-            f"{MODULE_ADDRESS}::tuition_escrow_v2::Store",
-        )
-        if not store_resource or not isinstance(store_resource, dict):
-            raise HTTPException(status_code=404, detail="Store resource not found")
-        data = store_resource.get("data") or {}
-        next_id_val = data.get("next_id")
-        if next_id_val is None:
-            raise HTTPException(status_code=500, detail="Malformed Store resource")
-        return {"next_id": int(next_id_val)}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get next_id: {str(e)}")
-
-# ...existing code...
 @app.get("/api/agreements", response_model=List[AgreementSummary])
+@cache(expire=STORE_CACHE_TTL_SECS, namespace=STORE_CACHE_NAMESPACE, key_builder=store_cache_key)
 async def list_agreements():
-    """List all agreements (placeholder - would need to parse Store resource)"""
-    # This would require parsing the Store resource to get all agreements
-    # For now, return empty list
-    return []
+    """List all agreements, fetched as concurrent get_agreements_range pages"""
+    try:
+        (next_id_val,) = await call_view_coalesced("get_next_id", [])
+        next_id = int(next_id_val)
+        sem = asyncio.Semaphore(LIST_MAX_CONCURRENCY)
+
+        async def fetch_page(start: int) -> List[Dict[str, Any]]:
+            end = min(start + LIST_PAGE_SIZE, next_id)
+            async with sem:
+                (page,) = await call_view_coalesced("get_agreements_range", [str(start), str(end)])
+            return page
+
+        pages = await asyncio.gather(*[fetch_page(start) for start in range(0, next_id, LIST_PAGE_SIZE)])
+        return [AgreementSummary(**summary) for page in pages for summary in page]
+    except ApiError as e:
+        raise view_error(e, "Store resource not found")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list agreements: {str(e)}")
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # One worker by default: every worker signs as the same payer and keeps its own sequence numbers,
+    # Store cache, view coalescing and tracked tx hashes. More workers (WEB_CONCURRENCY) need a shared
+    # cache and a single transaction submitter first. uvloop is not available on Windows.
+    uvicorn.run(
+        "app:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=WEB_CONCURRENCY,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning",
+    )
 
@@ -0,0 +1,47 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+# app.py resolves ../frontend relative to the working directory and reads its config at import
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+os.chdir(BACKEND_DIR)
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("MODULE_ADDRESS", "0x89019004bafcc06620c787f2d1be274da2c78005102a3a98b1eef112e242911f")
+os.environ.setdefault("PAYER_PRIVATE_KEY_HEX", "ed25519-priv-0x12eaa49bdbe263a3430b187f79b11a6e257c1226826bd6115afa1d3ef4c7e93c")
+
+import app as app_module  # noqa: E402
+
+
+class FakeRestClient:
+    """Stands in for the Aptos RestClient; the chain never commits anything, like a burst before commit"""
+
+    def __init__(self, on_chain_sequence_number: int = 5):
+        self.on_chain_sequence_number = on_chain_sequence_number
+        self.signed_sequence_numbers = []
+
+    async def close(self):
+        pass
+
+    async def account_sequence_number(self, address):
+        return self.on_chain_sequence_number
+
+    async def create_bcs_signed_transaction(self, sender, payload, sequence_number=None):
+        # Same fallback as the SDK: without an explicit number, ask the node for the committed count
+        if sequence_number is None:
+            sequence_number = await self.account_sequence_number(sender.address())
+        self.signed_sequence_numbers.append(sequence_number)
+        return sequence_number
+
+    async def submit_bcs_transaction(self, signed_transaction):
+        return f"0x{signed_transaction:064x}"
+
+
+@pytest.fixture
+def api():
+    with TestClient(app_module.app) as test_client:
+        fake = FakeRestClient()
+        app_module.client = fake
+        yield test_client, fake
@@ -0,0 +1,49 @@
+import pytest
+
+
+AGREEMENT = {
+    "total_amount": 30,
+    "num_installments": 3,
+    "installment_amount": 10,
+    "interval_days": 30,
+    "penalty_rate": 100,
+    "grace_period_days": 5,
+}
+
+
+def test_back_to_back_submissions_get_distinct_sequence_numbers(api):
+    test_client, fake = api
+
+    first = test_client.post("/api/agreements", json=AGREEMENT)
+    second = test_client.post("/api/agreements/0/pay")
+
+    assert first.status_code == 200 and first.json()["success"]
+    assert second.status_code == 200 and second.json()["success"]
+    assert fake.signed_sequence_numbers == [5, 6]
+    assert first.json()["transaction_hash"] != second.json()["transaction_hash"]
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("total_amount", -1),
+        ("num_installments", -1),
+        ("installment_amount", -1),
+        ("penalty_rate", -1),
+        ("installment_amount", 2**64),
+    ],
+)
+def test_out_of_range_u64_fields_are_rejected(api, field, value):
+    test_client, fake = api
+
+    response = test_client.post("/api/agreements", json={**AGREEMENT, field: value})
+
+    assert response.status_code == 422
+    assert fake.signed_sequence_numbers == []
+
+
+def test_negative_agreement_id_is_rejected(api):
+    test_client, fake = api
+
+    assert test_client.post("/api/agreements/-1/pay").status_code == 422
+    assert fake.signed_sequence_numbers == []
@@ -2,9 +2,14 @@ import os
 import sys
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from aptos_sdk.account import Account
 
+# Shared session so repeated faucet calls reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def load_account_from_env() -> Account:
 
@@ -27,10 +32,10 @@ def fund(address_hex: str, amount: int) -> None:
 
 	faucet_url = os.getenv("FAUCET_URL", "https://faucet.devnet.aptoslabs.com")
 	url = f"{faucet_url}/mint?amount={amount}&address={address_hex}"
-	r = requests.post(url, timeout=30)
+	r = _SESSION.post(url, timeout=30)
 	if r.status_code >= 400:
 		raise SystemExit(f"Faucet error {r.status_code}: {r.text}")
-	print(f"Faucet response: {r.text}")
+	print(f"Faucet response: {r.json()}")
 
 
 def main() -> None:
@@ -1,8 +1,10 @@
 module TuitionEscrow::tuition_escrow_v2 {
 	use std::signer;
 	use std::error;
+	use std::vector;
 
 	use 0x1::coin;
+	use 0x1::event;
 	use 0x1::aptos_coin::AptosCoin;
 	use 0x1::timestamp;
 	use aptos_std::table::{Self, Table};
@@ -38,6 +40,12 @@ module TuitionEscrow::tuition_escrow_v2 {
 		total_paid: u64,
 	}
 
+	#[event]
+	struct AgreementCreatedEvent has drop, store {
+		id: u64,
+		payer: address,
+	}
+
 	struct Store has key {
 		agreements: Table<u64, Agreement>,
 		next_id: u64,
@@ -62,9 +70,10 @@ module TuitionEscrow::tuition_escrow_v2 {
 		let store = borrow_global_mut<Store>(@TuitionEscrow);
 		let id = store.next_id;
 		store.next_id = id + 1;
+		let payer = signer::address_of(payer_signer);
 		let agreement = Agreement {
 			id,
-			payer: signer::address_of(payer_signer),
+			payer,
 			installment_amount,
 			total_installments,
 			paid_installments: 0,
@@ -75,6 +84,7 @@ module TuitionEscrow::tuition_escrow_v2 {
 			total_paid: 0,
 		};
 		table::add(&mut store.agreements, id, agreement);
+		event::emit(AgreementCreatedEvent { id, payer });
 	}
 
 	public entry fun pay_next_installment(payer_signer: &signer, agreement_id: u64) acquires Store {
@@ -111,7 +121,24 @@ module TuitionEscrow::tuition_escrow_v2 {
 	#[view]
 	public fun get_agreement_summary(agreement_id: u64): AgreementSummary acquires Store {
 		let store = borrow_global<Store>(@TuitionEscrow);
-		let a = table::borrow(&store.agreements, agreement_id);
+		summary_of(table::borrow(&store.agreements, agreement_id))
+	}
+
+	/// Summaries for ids in [start, end); end is clamped to next_id so callers can page past the last id
+	#[view]
+	public fun get_agreements_range(start: u64, end: u64): vector<AgreementSummary> acquires Store {
+		let store = borrow_global<Store>(@TuitionEscrow);
+		let end = if (end > store.next_id) { store.next_id } else { end };
+		let summaries = vector::empty<AgreementSummary>();
+		let id = start;
+		while (id < end) {
+			vector::push_back(&mut summaries, summary_of(table::borrow(&store.agreements, id)));
+			id = id + 1;
+		};
+		summaries
+	}
+
+	fun summary_of(a: &Agreement): AgreementSummary {
 		AgreementSummary {
 			id: a.id,
 			payer: a.payer,